@@ -2,7 +2,7 @@ import unittest
 import numpy as np
 from xrd_simulator.detector import Detector
 from xrd_simulator.phase import Phase
-from xrd_simulator.scattering_unit import ScatteringUnit
+from xrd_simulator.scattering_unit import ScatteringUnit, ScatteringTable
 from scipy.spatial import ConvexHull
 from scipy.spatial.transform import Rotation
 import os
@@ -658,6 +658,46 @@ class TestDetector(unittest.TestCase):
             self.assertTrue(np.sum(diffraction_pattern[~np.isinf(diffraction_pattern)])==0)
 
 
+    def test_centroid_render_scattering_table(self):
+        wavelength = 1.0
+        data = os.path.join(os.path.join(os.path.dirname(__file__), 'data'), 'Fe_mp-150_conventional_standard.cif')
+        phase = Phase([3.64570000, 3.64570000, 3.64570000, 90.0, 90.0, 90.0], 'Fm-3m', path_to_cif_file=data)
+        phase.setup_diffracting_planes(wavelength, 0, 20 * np.pi / 180)
+        n = 300
+        scattered_wave_vector = np.random.rand(n, 3) + np.array([1, 0, 0])
+        scattered_wave_vector[0] = np.array([1, 0, 0.1])  # eta=0, np.inf lorentz factor
+        scattered_wave_vector = 2 * np.pi * scattered_wave_vector / \
+            (np.linalg.norm(scattered_wave_vector, axis=1)[:, np.newaxis] * wavelength)
+        scattering_table = ScatteringTable(
+            scattered_wave_vector=scattered_wave_vector,
+            time=np.zeros((n,)),
+            hkl_indx=np.random.randint(0, phase.miller_indices.shape[0], size=(n,)),
+            phase_indx=np.zeros((n,)),
+            element_index=np.arange(n),
+            zd=np.random.rand(n) * self.detector_size * 1.2,
+            yd=np.random.rand(n) * self.detector_size * 1.2,
+            volume=np.random.rand(n),
+            incident_wave_vector=2 * np.pi * np.array([1, 0, 0]) / wavelength,
+            wavelength=wavelength,
+            incident_polarization_vector=np.array([0, 1, 0]),
+            rotation_axis=np.array([0, 0, 1]),
+            phases=[phase])
+
+        frame = np.zeros(self.detector.pixel_coordinates.shape[0:2])
+        self.detector._centroid_render(scattering_table, frame, True, True, True)
+        expected_frame = np.zeros(self.detector.pixel_coordinates.shape[0:2])
+        for scattering_unit in scattering_table:
+            if self.detector.contains(scattering_unit.zd, scattering_unit.yd):
+                row, col = self.detector._detector_coordinate_to_pixel_index(scattering_unit.zd, scattering_unit.yd)
+                expected_frame[row, col] += scattering_unit.volume * \
+                    self.detector._get_intensity_factor(scattering_unit, True, True, True)
+
+        self.assertEqual(np.sum(np.isinf(frame)), 1)
+        self.assertTrue(np.array_equal(np.isinf(frame), np.isinf(expected_frame)))
+        finite = ~np.isinf(frame)
+        self.assertTrue(np.allclose(frame[finite], expected_frame[finite]))
+        self.assertGreater(np.sum(frame[finite]), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from xrd_simulator.scattering_unit import ScatteringUnit
+from xrd_simulator.scattering_unit import ScatteringUnit, ScatteringTable
 from scipy.spatial import ConvexHull
 from xrd_simulator.phase import Phase
 import os
@@ -95,5 +95,74 @@ class TestScatteringUnit(unittest.TestCase):
         self.assertAlmostEqual(vol, 1 / 6., msg="volume is wrong")
 
 
+class TestScatteringTable(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(10)
+        self.wavelength = 1.0
+        data = os.path.join(
+            os.path.join(
+                os.path.dirname(__file__),
+                'data'),
+            'Fe_mp-150_conventional_standard.cif')
+        unit_cell = [3.64570000, 3.64570000, 3.64570000, 90.0, 90.0, 90.0]
+        self.phase = Phase(unit_cell, 'Fm-3m', path_to_cif_file=data)
+        self.phase.setup_diffracting_planes(
+            self.wavelength, 0, 20 * np.pi / 180)
+        self.n = 7
+        tet = np.array([[0, 0, 0], [0, 0, 1], [0, 1, 0], [1, 0, 0]], dtype=float)
+        self.vertices = tet[np.newaxis, :, :] + np.random.rand(self.n, 1, 3)
+        self.table = ScatteringTable(
+            scattered_wave_vector=np.random.rand(self.n, 3),
+            time=np.random.rand(self.n),
+            hkl_indx=np.arange(self.n),
+            phase_indx=np.zeros((self.n,)),
+            element_index=np.arange(self.n)[::-1],
+            zd=np.random.rand(self.n),
+            yd=np.random.rand(self.n),
+            volume=np.ones((self.n,)) / 6.,
+            incident_wave_vector=2 * np.pi * np.array([1, 0., 0]) / self.wavelength,
+            wavelength=self.wavelength,
+            incident_polarization_vector=np.array([0., 1., 0]),
+            rotation_axis=np.array([0., 0, 1.]),
+            phases=[self.phase],
+            vertices=self.vertices)
+
+    def test_row_view(self):
+        scattering_unit = self.table[3]
+        self.assertTrue(isinstance(scattering_unit, ScatteringUnit))
+        self.assertEqual(scattering_unit.hkl_indx, 3)
+        self.assertEqual(scattering_unit.element_index, self.n - 4)
+        self.assertAlmostEqual(scattering_unit.time, self.table.time[3])
+        self.assertAlmostEqual(scattering_unit.convex_hull.volume, 1 / 6.)
+        self.assertTrue(np.allclose(scattering_unit.centroid, np.mean(self.vertices[3], axis=0)))
+        self.assertTrue(np.allclose(scattering_unit.hkl, self.phase.miller_indices[3]))
+        self.assertEqual(len(list(self.table)), self.n)
+
+    def test_slicing_and_sort(self):
+        mask = self.table.time > 0.5
+        sub_table = self.table[mask]
+        self.assertEqual(len(sub_table), np.sum(mask))
+        self.assertTrue(np.allclose(sub_table.vertices, self.vertices[mask]))
+        sorted_table = self.table.sort(by="time")
+        self.assertTrue(np.all(np.diff(sorted_table.time) >= 0))
+        self.assertTrue(np.allclose(sorted_table.hkl, self.phase.miller_indices[np.argsort(self.table.time)]))
+
+    def test_concatenate(self):
+        table = ScatteringTable.concatenate([self.table[0:2], ScatteringTable.empty(), self.table[2:]])
+        self.assertEqual(len(table), self.n)
+        for name in ScatteringTable._columns:
+            self.assertTrue(np.allclose(getattr(table, name), getattr(self.table, name)))
+        self.assertTrue(np.allclose(table.vertices, self.vertices))
+
+    def test_from_scattering_units(self):
+        table = ScatteringTable.from_scattering_units(list(self.table))
+        self.assertEqual(len(table), self.n)
+        self.assertTrue(table.phases[0] is self.phase)
+        self.assertTrue(np.allclose(table.volume, 1 / 6.))
+        self.assertTrue(np.allclose(np.sort(table.centroid, axis=0), np.sort(self.table.centroid, axis=0)))
+        self.assertTrue(np.allclose(table.scattered_wave_vector, self.table.scattered_wave_vector))
+
+
 if __name__ == '__main__':
     unittest.main()
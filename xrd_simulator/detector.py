@@ -14,8 +14,10 @@ Below follows a detailed description of the detector class attributes and functi
 
 import numpy as np
 from xrd_simulator import utils
+from xrd_simulator.scattering_unit import ScatteringTable
 import dill
 from scipy.signal import convolve2d
+from scipy.spatial import ConvexHull
 from multiprocessing import Pool
 
 
@@ -40,7 +42,8 @@ class Detector:
         pixel_size_y (:obj:`float`): Pixel side length along ydhat (rectangular pixels) in units of microns.
         det_corner_0,det_corner_1,det_corner_2 (:obj:`numpy array`): Detector corner 3d coordinates ``shape=(3,)``.
             The origin of the detector is at det_corner_0.
-        frames (:obj:`list` of :obj:`list` of :obj:`scattering_unit.ScatteringUnit`): Analytical diffraction patterns which
+        frames (:obj:`list` of :obj:`scattering_unit.ScatteringTable`): Analytical diffraction patterns, one table of
+            scattering units per frame. Frames may also be given as a :obj:`list` of :obj:`scattering_unit.ScatteringUnit`.
         zdhat,ydhat (:obj:`numpy array`): Detector basis vectors.
         normal (:obj:`numpy array`): Detector normal, fromed as the cross product: numpy.cross(self.zdhat, self.ydhat)
         zmax,ymax (:obj:`numpy array`): Detector width and height.
@@ -221,25 +224,50 @@ class Detector:
             frame = np.zeros(
                 (self.pixel_coordinates.shape[0], self.pixel_coordinates.shape[1])
             )
-            for si, scattering_unit in enumerate(self.frames[frame_index]):
-                if verbose:
-                    progress_bar_message = (
-                        "Rendering "
-                        + str(len(self.frames[frame_index]))
-                        + " scattering volumes unto the detector"
-                    )
-                    progress_fraction = float(si + 1) / len(self.frames[frame_index])
-                    utils._print_progress(
-                        progress_fraction, message=progress_bar_message
-                    )
-                renderer(
-                    scattering_unit, frame, lorentz, polarization, structure_factor
-                )
+            renderer(
+                self._get_scattering_table(frame_index),
+                frame,
+                lorentz,
+                polarization,
+                structure_factor,
+                verbose,
+            )
             if kernel is not None:
                 frame = self._apply_point_spread_function(frame, kernel)
             rendered_frames.append(frame)
         return rendered_frames
 
+    def _render_scattering_units(
+        self,
+        unit_renderer,
+        scattering_table,
+        frame,
+        lorentz,
+        polarization,
+        structure_factor,
+        verbose,
+    ):
+        """Render a frame by calling unit_renderer once per scattering unit of the scattering_table."""
+        for si, scattering_unit in enumerate(scattering_table):
+            if verbose:
+                progress_bar_message = (
+                    "Rendering "
+                    + str(len(scattering_table))
+                    + " scattering volumes unto the detector"
+                )
+                progress_fraction = float(si + 1) / len(scattering_table)
+                utils._print_progress(progress_fraction, message=progress_bar_message)
+            unit_renderer(
+                scattering_unit, frame, lorentz, polarization, structure_factor
+            )
+
+    def _get_scattering_table(self, frame_index):
+        """Get a frame as a :class:`xrd_simulator.scattering_unit.ScatteringTable`, lists of scattering units are converted."""
+        frame = self.frames[frame_index]
+        if isinstance(frame, ScatteringTable):
+            return frame
+        return ScatteringTable.from_scattering_units(frame)
+
     def _apply_point_spread_function(self, frame, kernel):
         """Apply the point spread function to a rendered pixelated frame by convolution.
 
@@ -492,25 +520,70 @@ class Detector:
         return pixel_coordinates
 
     def _centroid_render(
-        self, scattering_unit, frame, lorentz, polarization, structure_factor
+        self,
+        scattering_table,
+        frame,
+        lorentz,
+        polarization,
+        structure_factor,
+        verbose=False,
     ):
         """Simple deposit of intensity for each scattering_unit onto the detector by tracing a line from the
         sample scattering region centroid to the detector plane. The intensity is deposited into a single
         detector pixel regardless of the geometrical shape of the scattering_unit.
-        """
-        zd, yd = scattering_unit.zd, scattering_unit.yd
 
-        if self.contains(zd, yd):
-            intensity_scaling_factor = self._get_intensity_factor(
-                scattering_unit, lorentz, polarization, structure_factor
+        All scattering units of the scattering_table are deposited at once by a weighted bincount over the
+        flattened pixel indices.
+        """
+        scattering_table = scattering_table[
+            self.contains(scattering_table.zd, scattering_table.yd)
+        ]
+        if len(scattering_table) == 0:
+            return
+        intensity_scaling_factors = self._get_intensity_factors(
+            scattering_table, lorentz, polarization, structure_factor
+        )
+        rows, cols = self._detector_coordinates_to_pixel_indices(
+            scattering_table.zd, scattering_table.yd, frame.shape
+        )
+        pixel_indices = np.ravel_multi_index((rows, cols), frame.shape)
+        infmask = np.isinf(intensity_scaling_factors)
+        frame += np.bincount(
+            pixel_indices[~infmask],
+            weights=scattering_table.volume[~infmask]
+            * intensity_scaling_factors[~infmask],
+            minlength=frame.size,
+        ).reshape(frame.shape)
+        frame.flat[pixel_indices[infmask]] = np.inf
+        if verbose:
+            utils._print_progress(
+                1.0,
+                message="Rendering "
+                + str(len(scattering_table))
+                + " scattering volumes unto the detector",
             )
-            row, col = self._detector_coordinate_to_pixel_index(zd, yd)
-            if np.isinf(intensity_scaling_factor):
-                frame[row, col] += np.inf
-            else:
-                frame[row, col] += scattering_unit.volume * intensity_scaling_factor
 
     def _centroid_render_with_scintillator(
+        self,
+        scattering_table,
+        frame,
+        lorentz,
+        polarization,
+        structure_factor,
+        verbose=False,
+    ):
+        """Render all scattering units of a frame with :obj:`_centroid_render_with_scintillator_scattering_unit`."""
+        self._render_scattering_units(
+            self._centroid_render_with_scintillator_scattering_unit,
+            scattering_table,
+            frame,
+            lorentz,
+            polarization,
+            structure_factor,
+            verbose,
+        )
+
+    def _centroid_render_with_scintillator_scattering_unit(
         self, scattering_unit, frame, lorentz, polarization, structure_factor
     ):
         """Simple deposit of intensity for each scattering_unit onto the detector by tracing a line from the
@@ -551,38 +624,116 @@ class Detector:
                 )
 
     def _projection_render(
-        self, scattering_unit, frame, lorentz, polarization, structure_factor
+        self,
+        scattering_table,
+        frame,
+        lorentz,
+        polarization,
+        structure_factor,
+        verbose=False,
     ):
         """Raytrace and project the scattering regions onto the detector plane for increased peak shape accuracy.
         This is generally very computationally expensive compared to the simpler (:obj:`function`):_centroid_render
         function.
 
+        All scattering regions of the frame are passed as padded halfspace arrays to the parallel
+        :func:`xrd_simulator.utils._project_convex_polyhedra` kernel in a single call.
+
         NOTE: If the projection of the scattering_unit does not hit any pixel centroids of the detector fallback to
         the (:obj:`function`):_centroid_render function is used to deposit the intensity into a single detector pixel.
         """
-        box = self._get_projected_bounding_box(scattering_unit)
-        if box is not None:
-            projection = self.project(scattering_unit, box)
-            if np.sum(projection) == 0:
-                # The projection of the scattering_unit did not hit any pixel centroids of the detector.
-                # i.e the scattering_unit is small in comparison to the detector
-                # pixels.
-                self._centroid_render(
-                    scattering_unit, frame, lorentz, polarization, structure_factor
-                )
-            else:
-                intensity_scaling_factor = self._get_intensity_factor(
-                    scattering_unit, lorentz, polarization, structure_factor
-                )
-                if np.isinf(intensity_scaling_factor):
-                    frame[box[0] : box[1], box[2] : box[3]] += np.inf
-                else:
-                    frame[box[0] : box[1], box[2] : box[3]] += (
-                        projection
-                        * intensity_scaling_factor
-                        * self.pixel_size_z
-                        * self.pixel_size_y
-                    )
+        if scattering_table.vertices is None:
+            raise ValueError(
+                "Projection rendering requires the vertices of the scattering regions."
+            )
+        boxes, is_projected = self._get_projected_bounding_boxes(scattering_table)
+        scattering_table, boxes = scattering_table[is_projected], boxes[is_projected]
+        if len(scattering_table) == 0:
+            return
+
+        intensity_scaling_factors = self._get_intensity_factors(
+            scattering_table, lorentz, polarization, structure_factor
+        )
+        infmask = np.isinf(intensity_scaling_factors)
+        weights = np.where(
+            infmask,
+            0,
+            intensity_scaling_factors * self.pixel_size_z * self.pixel_size_y,
+        )
+        plane_normals, plane_offsets, number_of_planes = self._get_halfspaces(
+            scattering_table
+        )
+        ray_directions = scattering_table.scattered_wave_vector / np.linalg.norm(
+            scattering_table.scattered_wave_vector, axis=1
+        ).reshape(-1, 1)
+
+        projection, clip_length_sums = utils._project_convex_polyhedra(
+            np.asarray(self.det_corner_0, dtype=np.float64),
+            self.zdhat,
+            self.ydhat,
+            float(self.pixel_size_z),
+            float(self.pixel_size_y),
+            frame.shape,
+            boxes,
+            np.ascontiguousarray(ray_directions),
+            plane_normals,
+            plane_offsets,
+            number_of_planes,
+            weights,
+        )
+        frame += projection
+
+        for box in boxes[infmask & (clip_length_sums > 0)]:
+            frame[box[0] : box[1], box[2] : box[3]] += np.inf
+
+        # The projection of these scattering_units did not hit any pixel centroids of the detector.
+        # i.e the scattering_units are small in comparison to the detector pixels.
+        self._centroid_render(
+            scattering_table[clip_length_sums == 0],
+            frame,
+            lorentz,
+            polarization,
+            structure_factor,
+        )
+        if verbose:
+            utils._print_progress(
+                1.0,
+                message="Rendering "
+                + str(len(scattering_table))
+                + " scattering volumes unto the detector",
+            )
+
+    def _get_halfspaces(self, scattering_table):
+        """Compute padded halfspace equations of the scattering regions of a scattering_table.
+
+        Tetrahedral regions are handled analytically while other regions go through a convex hull.
+
+        Returns:
+            (:obj:`tuple`) outwards plane normals ``shape=(n,m,3)``, plane offsets ``shape=(n,m)`` and the number
+            of (non padded) planes of each region ``shape=(n,)``.
+
+        """
+        vertices = scattering_table.vertices
+        number_of_vertices = np.sum(~np.isnan(vertices[:, :, 0]), axis=1)
+        is_tetrahedron = number_of_vertices == 4
+        equations = [
+            ConvexHull(v[0:nv]).equations
+            for v, nv in zip(vertices[~is_tetrahedron], number_of_vertices[~is_tetrahedron])
+        ]
+        max_number_of_planes = max([4] + [eq.shape[0] for eq in equations])
+        plane_normals = np.zeros((len(scattering_table), max_number_of_planes, 3))
+        plane_offsets = np.zeros((len(scattering_table), max_number_of_planes))
+        number_of_planes = np.full((len(scattering_table),), 4, dtype=np.int64)
+
+        tetrahedra = vertices[is_tetrahedron][:, 0:4, :]
+        plane_normals[is_tetrahedron, 0:4], plane_offsets[is_tetrahedron, 0:4] = (
+            utils._get_tetrahedron_halfspaces(tetrahedra)
+        )
+        for i, eq in zip(np.where(~is_tetrahedron)[0], equations):
+            plane_normals[i, 0 : eq.shape[0]] = eq[:, 0:3]
+            plane_offsets[i, 0 : eq.shape[0]] = eq[:, 3]
+            number_of_planes[i] = eq.shape[0]
+        return plane_normals, plane_offsets, number_of_planes
 
     def _get_intensity_factor(
         self, scattering_unit, lorentz, polarization, structure_factor
@@ -606,51 +757,66 @@ class Detector:
 
         return intensity_factor
 
+    def _get_intensity_factors(
+        self, scattering_table, lorentz, polarization, structure_factor
+    ):
+        """Vectorized :obj:`_get_intensity_factor` over all rows of a scattering_table."""
+        intensity_factors = np.ones((len(scattering_table),))
+        if lorentz:
+            intensity_factors *= scattering_table.lorentz_factor
+        if polarization:
+            intensity_factors *= scattering_table.polarization_factor
+        if structure_factor:
+            intensity_factors *= scattering_table.structure_factor
+        return intensity_factors
+
+    def _detector_coordinates_to_pixel_indices(self, zd, yd, frame_shape):
+        """Vectorized :obj:`_detector_coordinate_to_pixel_index`, indices at the far detector edges are clipped
+        to the last pixel of the frame."""
+        row_indices = np.minimum((zd / self.pixel_size_z).astype(int), frame_shape[0] - 1)
+        col_indices = np.minimum((yd / self.pixel_size_y).astype(int), frame_shape[1] - 1)
+        return row_indices, col_indices
+
     def _detector_coordinate_to_pixel_index(self, zd, yd):
         row_index = int(zd / self.pixel_size_z)
         col_index = int(yd / self.pixel_size_y)
         return row_index, col_index
 
-    def _get_projected_bounding_box(self, scattering_unit):
-        """Compute bounding detector pixel indices of the bounding the projection of a scattering region.
+    def _get_projected_bounding_boxes(self, scattering_table):
+        """Compute bounding detector pixel indices of the projections of the scattering regions of a scattering_table.
 
         Args:
-            scattering_unit (:obj:`xrd_simulator.ScatteringUnit`): The scattering region.
+            scattering_table (:obj:`xrd_simulator.ScatteringTable`): The scattering regions.
 
         Returns:
-            (:obj:`tuple` of :obj:`int`) indices that can be used to slice the detector frame array and get the pixels that
-                are within the bounding box.
+            (:obj:`tuple`) pixel index boxes ``shape=(n,4)`` such that ``frame[box[0]:box[1], box[2]:box[3]]`` are
+                the pixels within the bounding box of a region, and a boolean mask ``shape=(n,)`` that is False for
+                regions which projections fall outside the detector.
 
         """
-        vertices = scattering_unit.convex_hull.points[
-            scattering_unit.convex_hull.vertices
-        ]
-
+        vertices = scattering_table.vertices
+        n, m = vertices.shape[0], vertices.shape[1]
         projected_vertices = self.get_intersection(
-            scattering_unit.scattered_wave_vector, vertices
+            np.repeat(scattering_table.scattered_wave_vector, m, axis=0),
+            vertices.reshape(n * m, 3),
+        ).reshape(n, m, 2)
+
+        # np.fmin/np.fmax ignore the np.nan padding of the vertices.
+        min_zd = np.maximum(np.fmin.reduce(projected_vertices[:, :, 0], axis=1), 0)
+        max_zd = np.minimum(np.fmax.reduce(projected_vertices[:, :, 0], axis=1), self.zmax)
+        min_yd = np.maximum(np.fmin.reduce(projected_vertices[:, :, 1], axis=1), 0)
+        max_yd = np.minimum(np.fmax.reduce(projected_vertices[:, :, 1], axis=1), self.ymax)
+
+        is_projected = (min_zd <= max_zd) & (min_yd <= max_yd)
+        boxes = np.zeros((n, 4), dtype=np.int64)
+        boxes[is_projected, 0] = (min_zd[is_projected] / self.pixel_size_z).astype(int)
+        boxes[is_projected, 1] = np.minimum(
+            (max_zd[is_projected] / self.pixel_size_z).astype(int) + 1,
+            int(self.zmax / self.pixel_size_z),
         )
-
-        min_zd, max_zd = np.min(projected_vertices[:, 0]), np.max(
-            projected_vertices[:, 0]
-        )
-        min_yd, max_yd = np.min(projected_vertices[:, 1]), np.max(
-            projected_vertices[:, 1]
+        boxes[is_projected, 2] = (min_yd[is_projected] / self.pixel_size_y).astype(int)
+        boxes[is_projected, 3] = np.minimum(
+            (max_yd[is_projected] / self.pixel_size_y).astype(int) + 1,
+            int(self.ymax / self.pixel_size_y),
         )
-
-        min_zd, max_zd = np.max([min_zd, 0]), np.min([max_zd, self.zmax])
-        min_yd, max_yd = np.max([min_yd, 0]), np.min([max_yd, self.ymax])
-
-        if min_zd > max_zd or min_yd > max_yd:
-            return None
-
-        min_row_indx, min_col_indx = self._detector_coordinate_to_pixel_index(
-            min_zd, min_yd
-        )
-        max_row_indx, max_col_indx = self._detector_coordinate_to_pixel_index(
-            max_zd, max_yd
-        )
-
-        max_row_indx = np.min([max_row_indx + 1, int(self.zmax / self.pixel_size_z)])
-        max_col_indx = np.min([max_col_indx + 1, int(self.ymax / self.pixel_size_y)])
-
-        return min_row_indx, max_row_indx, min_col_indx, max_col_indx
+        return boxes, is_projected
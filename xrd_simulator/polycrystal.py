@@ -13,11 +13,10 @@ Below follows a detailed description of the polycrystal class attributes and fun
 import copy
 from multiprocessing import Pool
 import numpy as np
-from scipy.spatial import ConvexHull
 import pandas as pd
 import dill
 from xfab import tools
-from xrd_simulator.scattering_unit import ScatteringUnit
+from xrd_simulator.scattering_unit import ScatteringTable, _pad_vertices
 from xrd_simulator import utils, laue
 
 
@@ -37,12 +36,13 @@ def _diffract(dict):
             - 'eB' (numpy.ndarray): Array containing per-element 3x3 B matrices mapping hkl values to crystal coordinates.
             - 'element_phase_map' (numpy.ndarray): Array mapping elements to phases.
             - 'ecoord' (numpy.ndarray): Array containing coordinates of the scattering elements.
+            - 'element_index' (numpy.ndarray): Array containing the polycrystal indices of the scattering elements.
             - 'verbose' (bool): Flag indicating whether to print progress.
             - 'proximity' (bool): Flag indicating whether to remove grains unlikely to be hit by the beam.
             - 'BB_intersection' (bool): Flag indicating whether to use Bounding-Box intersection for speed.
 
     Returns:
-        list: A list of ScatteringUnit objects representing diffraction events.
+        ScatteringTable: A table with one row per diffraction event.
     """
 
     beam = dict["beam"]
@@ -55,6 +55,7 @@ def _diffract(dict):
     eB = dict["eB"]
     element_phase_map = dict["element_phase_map"]
     ecoord = dict["ecoord"]
+    element_index = dict["element_index"]
     verbose = dict[
         "verbose"
     ]  # should be deprecated or repurposed since computation now takes place phase by phase not by individual scatterer
@@ -83,11 +84,11 @@ def _diffract(dict):
         eB = np.float32(eB[possible_scatterers_mask])
         element_phase_map = element_phase_map[possible_scatterers_mask]
         ecoord = np.float32(ecoord[possible_scatterers_mask])
+        element_index = element_index[possible_scatterers_mask]
 
     reflections_df = (
         pd.DataFrame()
     )  # We create a dataframe to store all the relevant values for each individual reflection inr an organized manner
-    scattering_units = []  # The output
 
     # For each phase of the sample, we compute all reflections at once in a vectorized manner
     for i, phase in enumerate(phases):
@@ -153,78 +154,55 @@ def _diffract(dict):
     element_vertices_0 = ecoord[reflections_df["Grain"]]
     element_vertices = rigid_body_motion(
         element_vertices_0, reflections_df["time"].values
-    )
+    ).reshape(-1, 4, 3)
 
     reflections_np = (
         reflections_df.values
     )  # We move from pandas to numpy for enhanced speed
-    scattering_units = []
 
     if BB_intersection:
         # A Bounding-Box intersection is a simplified way of computing the grains that interact with the beam (to enhance speed),
         # simply considering the beam as a prism and the tets that interact are those whose centroid is contained in the prism.
-
-        reflections_np = reflections_np[
-            reflections_np[:, 14] < (beam.vertices[:, 1].max())
-        ]  #
-        reflections_np = reflections_np[
-            reflections_np[:, 14] > (beam.vertices[:, 1].min())
-        ]  #
-        reflections_np = reflections_np[
-            reflections_np[:, 15] < (beam.vertices[:, 2].max())
-        ]  #
-        reflections_np = reflections_np[
-            reflections_np[:, 15] > (beam.vertices[:, 2].min())
-        ]  #
-
-        for ei in range(reflections_np.shape[0]):
-            scattering_unit = ScatteringUnit(
-                ConvexHull(element_vertices[ei]),
-                reflections_np[ei, 10:13],  # outgoing wavevector
-                beam.wave_vector,
-                beam.wavelength,
-                beam.polarization_vector,
-                rigid_body_motion.rotation_axis,
-                reflections_np[ei, 3],  # time
-                phases[reflections_np[ei, 1].astype(int)],  # phase
-                reflections_np[ei, 2].astype(int),  # hkl index
-                ei,
-                zd=reflections_np[
-                    ei, 16
-                ],  # zd saved to avoid recomputing during redering
-                yd=reflections_np[ei, 17],
-            )  # yd saved to avoid recomputing during redering)
-
-            scattering_units.append(scattering_unit)
+        in_beam = (
+            (reflections_np[:, 14] < beam.vertices[:, 1].max())
+            & (reflections_np[:, 14] > beam.vertices[:, 1].min())
+            & (reflections_np[:, 15] < beam.vertices[:, 2].max())
+            & (reflections_np[:, 15] > beam.vertices[:, 2].min())
+        )
+        reflections_np = reflections_np[in_beam]
+        scattering_vertices = element_vertices[in_beam]
+        a = scattering_vertices[:, 1, :] - scattering_vertices[:, 0, :]
+        b = scattering_vertices[:, 2, :] - scattering_vertices[:, 0, :]
+        c = scattering_vertices[:, 3, :] - scattering_vertices[:, 0, :]
+        scattering_volumes = np.abs(np.sum(np.cross(a, b, axis=1) * c, axis=1)) / 6.0
 
     else:
         """Otherwise, compute the true intersection of each tet with the beam to get the true scattering volume."""
-        for ei in range(element_vertices.shape[0]):
-            scattering_region = beam.intersect(element_vertices[ei])
-
-            if scattering_region is not None:
-                scattering_unit = ScatteringUnit(
-                    scattering_region,
-                    reflections_np[ei, 10:13],  # outgoing wavevector
-                    beam.wave_vector,
-                    beam.wavelength,
-                    beam.polarization_vector,
-                    rigid_body_motion.rotation_axis,
-                    reflections_np[ei, 3],  # time
-                    phases[reflections_np[ei, 1].astype(int)],  # phase
-                    reflections_np[ei, 2].astype(int),  # hkl index
-                    ei,
-                    zd=reflections_np[
-                        ei, 16
-                    ],  # zd saved to avoid recomputing during redering
-                    yd=reflections_np[
-                        ei, 17
-                    ],  # yd saved to avoid recomputing during redering
-                )
-
-                scattering_units.append(scattering_unit)
-
-    return scattering_units
+        scattering_regions = [beam.intersect(ev) for ev in element_vertices]
+        is_hit = np.array([sr is not None for sr in scattering_regions], dtype=bool)
+        reflections_np = reflections_np[is_hit]
+        scattering_regions = [sr for sr in scattering_regions if sr is not None]
+        scattering_vertices = _pad_vertices(
+            [sr.points[sr.vertices] for sr in scattering_regions]
+        )
+        scattering_volumes = np.array([sr.volume for sr in scattering_regions])
+
+    return ScatteringTable(
+        scattered_wave_vector=reflections_np[:, 10:13],
+        time=reflections_np[:, 3],
+        hkl_indx=reflections_np[:, 2],
+        phase_indx=reflections_np[:, 1],
+        element_index=element_index[reflections_np[:, 0].astype(int)],
+        zd=reflections_np[:, 16],  # zd saved to avoid recomputing during redering
+        yd=reflections_np[:, 17],  # yd saved to avoid recomputing during redering
+        volume=scattering_volumes,
+        incident_wave_vector=beam.wave_vector,
+        wavelength=beam.wavelength,
+        incident_polarization_vector=beam.polarization_vector,
+        rotation_axis=rigid_body_motion.rotation_axis,
+        phases=phases,
+        vertices=scattering_vertices,
+    )
 
 
 class Polycrystal:
@@ -308,7 +286,8 @@ class Polycrystal:
     ):
         """Compute diffraction from the rotating and translating polycrystal while illuminated by an xray beam.
 
-        The xray beam interacts with the polycrystal producing scattering units which are stored in a detector frame.
+        The xray beam interacts with the polycrystal producing scattering units which are stored in a detector frame
+        as a :class:`xrd_simulator.scattering_unit.ScatteringTable`.
         The scattering units may be rendered as pixelated patterns on the detector by using a detector rendering
         option.
 
@@ -364,6 +343,9 @@ class Polycrystal:
             self.element_phase_map, number_of_processes, axis=0
         )
         enod = np.array_split(self.mesh_lab.enod, number_of_processes, axis=0)
+        element_index = np.array_split(
+            np.arange(self.mesh_lab.number_of_elements), number_of_processes
+        )
 
         args = []
         for i in range(number_of_processes):
@@ -382,6 +364,7 @@ class Polycrystal:
                     "eB": eB[i],
                     "element_phase_map": element_phase_map[i],
                     "ecoord": ecoord,
+                    "element_index": element_index[i],
                     "verbose": verbose,
                     "proximity": proximity,
                     "BB_intersection": BB_intersection,
@@ -389,34 +372,29 @@ class Polycrystal:
             )
 
         if number_of_processes == 1:
-            all_scattering_units = _diffract(args[0])
-
+            scattering_tables = [_diffract(args[0])]
         else:
             with Pool(number_of_processes) as p:
-                scattering_units = p.map(_diffract, args)
-            all_scattering_units = []
-            for su in scattering_units:
-                all_scattering_units.extend(su)
+                scattering_tables = p.map(_diffract, args)
+        scattering_table = ScatteringTable.concatenate(scattering_tables)
+        scattering_table.phases = self.phases
 
         if number_of_frames == 1:
-            detector.frames.append(all_scattering_units)
+            detector.frames.append(scattering_table)
         else:
             # TODO: unit test
-            all_scattering_units.sort(
-                key=lambda scattering_unit: scattering_unit.time, reverse=True
-            )
+            scattering_table = scattering_table.sort(by="time")
             dt = 1.0 / number_of_frames
             start_time_of_current_frame = 0
+            start_row = 0
             while start_time_of_current_frame <= 1 - 1e-8:
-                frame = []
-                while (
-                    len(all_scattering_units) > 0
-                    and all_scattering_units[-1].time < start_time_of_current_frame + dt
-                ):
-                    frame.append(all_scattering_units.pop())
+                stop_row = np.searchsorted(
+                    scattering_table.time, start_time_of_current_frame + dt, side="left"
+                )
+                detector.frames.append(scattering_table[start_row:stop_row])
+                start_row = stop_row
                 start_time_of_current_frame += dt
-                detector.frames.append(frame)
-            assert len(all_scattering_units) == 0
+            assert start_row == len(scattering_table)
 
     def transform(self, rigid_body_motion, time):
         """Transform the polycrystal by performing a rigid body motion (translation + rotation)
@@ -3,9 +3,13 @@ For advanced users it can be usefull to interact with the scattering units, this
 :class:`xrd_simulator.detector.Detector` which will hold all the scatterign units created during diffraction
 from the polycrystal.
 
+The scattering units of a frame are stored column wise in a :class:`xrd_simulator.scattering_unit.ScatteringTable`,
+indexing the table with an integer gives a :class:`xrd_simulator.scattering_unit.ScatteringUnit` row view.
+
 """
 
 import numpy as np
+from scipy.spatial import ConvexHull
 
 
 class ScatteringUnit(object):
@@ -38,6 +42,11 @@ class ScatteringUnit(object):
         hkl_indx (:obj:`int`): Index of Miller index in the `phase.miller_indices` list.
         element_index (:obj:`int`): Index of mesh tetrahedral element refering to a `xrd_simulator.polycrystal.Polycrystal`
             object from which the scattering unit originated.
+        zd, yd (:obj:`float`): Detector coordinates of the scattering unit centroid ray. Defaults to None.
+        vertices (:obj:`numpy array`): Vertices of the scattering region ``shape=(N,3)``. Only used when ``convex_hull``
+            is None, in which case the hull is computed from the vertices on first access. Defaults to None.
+        volume (:obj:`float`): Precomputed volume of the scattering region. Defaults to None, in which case the volume
+            is read from the convex hull.
     """
 
     def __init__(
@@ -54,8 +63,12 @@ class ScatteringUnit(object):
         element_index,
         zd=None,
         yd=None,
+        vertices=None,
+        volume=None,
     ):
-        self.convex_hull = convex_hull
+        self._convex_hull = convex_hull
+        self._vertices = vertices
+        self._volume = volume
         self.scattered_wave_vector = scattered_wave_vector
         self.incident_wave_vector = incident_wave_vector
         self.wavelength = wavelength
@@ -68,6 +81,19 @@ class ScatteringUnit(object):
         self.yd = yd
         self.element_index = element_index
 
+    @property
+    def convex_hull(self):
+        """convex_hull (:obj:`scipy.spatial.ConvexHull`): Object describing the convex hull of the scattering unit."""
+        if self._convex_hull is None and self._vertices is not None:
+            self._convex_hull = ConvexHull(self._vertices)
+        return self._convex_hull
+
+    @convex_hull.setter
+    def convex_hull(self, convex_hull):
+        self._convex_hull = convex_hull
+        self._vertices = None
+        self._volume = None
+
     @property
     def hkl(self):
         """hkl (:obj:`numpy array`): Miller indices [h,k,l] ``shape=(3,)``."""
@@ -118,9 +144,313 @@ class ScatteringUnit(object):
     @property
     def centroid(self):
         """centroid (:obj:`numpy array`): centroid of the scattering region. ``shape=(3,)``"""
+        if self._convex_hull is None and self._vertices is not None:
+            return np.mean(self._vertices, axis=0)
         return np.mean(self.convex_hull.points[self.convex_hull.vertices], axis=0)
 
     @property
     def volume(self):
         """volume (:obj:`float`): volume of the scattering region volume"""
+        if self._volume is not None:
+            return self._volume
         return self.convex_hull.volume
+
+
+class ScatteringTable(object):
+    """Columnar (struct-of-arrays) store of all scattering units of a detector frame.
+
+    Each scattering unit is a row in the table and each quantity is a contiguous numpy column. Quantities that
+    are shared by all units of a diffraction computation, such as the incident wavevector, are stored once.
+    Indexing the table with an integer gives a :class:`xrd_simulator.scattering_unit.ScatteringUnit` row view
+    while indexing with a slice, integer array or boolean mask gives a new table.
+
+    Args:
+        scattered_wave_vector (:obj:`numpy array`): Scattered wavevectors ``shape=(n,3)``.
+        time (:obj:`numpy array`): Parametric times in range [0,1] of the scattering events ``shape=(n,)``.
+        hkl_indx (:obj:`numpy array`): Index of Miller index in the `phase.miller_indices` list ``shape=(n,)``.
+        phase_indx (:obj:`numpy array`): Index of the phase in the ``phases`` list ``shape=(n,)``.
+        element_index (:obj:`numpy array`): Index of mesh tetrahedral element from which the scattering units
+            originated ``shape=(n,)``.
+        zd, yd (:obj:`numpy array`): Detector coordinates of the scattering unit centroid rays ``shape=(n,)``.
+        volume (:obj:`numpy array`): Volumes of the scattering regions ``shape=(n,)``.
+        incident_wave_vector (:obj:`numpy array`): Incident wavevector ```shape=(3,)```
+        wavelength (:obj:`float`):  Wavelength of xrays in units of angstrom.
+        incident_polarization_vector (:obj:`numpy array`): Unit vector of linear polarization ```shape=(3,)```
+        rotation_axis (:obj:`numpy array`): Sample motion rotation axis ```shape=(3,)```
+        phases (:obj:`list` of :obj:`xrd_simulator.phase.Phase`): Phases refered to by ``phase_indx``.
+        vertices (:obj:`numpy array`): Vertices of the scattering regions padded with ``np.nan`` to a common number of
+            vertices ``shape=(n,m,3)``. Defaults to None, in which case no hulls are available for the units.
+
+    Attributes:
+        scattered_wave_vector, time, hkl_indx, phase_indx, element_index, zd, yd, volume, vertices: The columns
+            of the table as described above.
+        incident_wave_vector, wavelength, incident_polarization_vector, rotation_axis, phases: Quantities shared
+            by all rows of the table as described above.
+
+    """
+
+    _columns = (
+        "scattered_wave_vector",
+        "time",
+        "hkl_indx",
+        "phase_indx",
+        "element_index",
+        "zd",
+        "yd",
+        "volume",
+    )
+
+    def __init__(
+        self,
+        scattered_wave_vector,
+        time,
+        hkl_indx,
+        phase_indx,
+        element_index,
+        zd,
+        yd,
+        volume,
+        incident_wave_vector,
+        wavelength,
+        incident_polarization_vector,
+        rotation_axis,
+        phases,
+        vertices=None,
+    ):
+        self.scattered_wave_vector = np.asarray(scattered_wave_vector, dtype=np.float64).reshape(-1, 3)
+        self.time = np.asarray(time, dtype=np.float64).reshape(-1)
+        self.hkl_indx = np.asarray(hkl_indx, dtype=np.int64).reshape(-1)
+        self.phase_indx = np.asarray(phase_indx, dtype=np.int64).reshape(-1)
+        self.element_index = np.asarray(element_index, dtype=np.int64).reshape(-1)
+        self.zd = np.asarray(zd, dtype=np.float64).reshape(-1)
+        self.yd = np.asarray(yd, dtype=np.float64).reshape(-1)
+        self.volume = np.asarray(volume, dtype=np.float64).reshape(-1)
+        self.vertices = None if vertices is None else np.asarray(vertices, dtype=np.float64)
+        self.incident_wave_vector = incident_wave_vector
+        self.wavelength = wavelength
+        self.incident_polarization_vector = incident_polarization_vector
+        self.rotation_axis = rotation_axis
+        self.phases = phases
+
+    @classmethod
+    def from_scattering_units(cls, scattering_units):
+        """Assemble a table from a list of :class:`xrd_simulator.scattering_unit.ScatteringUnit`.
+
+        The shared quantities (incident wavevector, polarization, etc.) are taken from the first scattering unit.
+
+        Args:
+            scattering_units (:obj:`list` of :obj:`xrd_simulator.scattering_unit.ScatteringUnit`): Scattering units.
+
+        Returns:
+            (:obj:`xrd_simulator.scattering_unit.ScatteringTable`) with one row per scattering unit.
+
+        """
+        if len(scattering_units) == 0:
+            return cls.empty()
+        phases = []
+        for su in scattering_units:
+            if not any(su.phase is phase for phase in phases):
+                phases.append(su.phase)
+        phase_indx = [
+            next(i for i, phase in enumerate(phases) if su.phase is phase)
+            for su in scattering_units
+        ]
+        hulls = [su.convex_hull for su in scattering_units]
+        if any(hull is None for hull in hulls):
+            vertices = None
+        else:
+            vertices = _pad_vertices([hull.points[hull.vertices] for hull in hulls])
+        su = scattering_units[0]
+        return cls(
+            scattered_wave_vector=[s.scattered_wave_vector for s in scattering_units],
+            time=[s.time for s in scattering_units],
+            hkl_indx=[s.hkl_indx for s in scattering_units],
+            phase_indx=phase_indx,
+            element_index=[s.element_index for s in scattering_units],
+            zd=[np.nan if s.zd is None else s.zd for s in scattering_units],
+            yd=[np.nan if s.yd is None else s.yd for s in scattering_units],
+            volume=[s.volume for s in scattering_units],
+            incident_wave_vector=su.incident_wave_vector,
+            wavelength=su.wavelength,
+            incident_polarization_vector=su.incident_polarization_vector,
+            rotation_axis=su.rotation_axis,
+            phases=phases,
+            vertices=vertices,
+        )
+
+    @classmethod
+    def empty(cls, incident_wave_vector=None, wavelength=None,
+              incident_polarization_vector=None, rotation_axis=None, phases=None):
+        """Create a table without any rows.
+        """
+        return cls(
+            np.zeros((0, 3)), [], [], [], [], [], [], [],
+            incident_wave_vector, wavelength, incident_polarization_vector, rotation_axis,
+            [] if phases is None else phases,
+        )
+
+    @classmethod
+    def concatenate(cls, tables):
+        """Stack a sequence of tables, sharing the same beam and motion, into a single table.
+
+        Args:
+            tables (:obj:`list` of :obj:`xrd_simulator.scattering_unit.ScatteringTable`): Tables to stack.
+
+        Returns:
+            (:obj:`xrd_simulator.scattering_unit.ScatteringTable`) holding all rows of the tables in order.
+
+        """
+        tables = list(tables)
+        columns = {
+            name: np.concatenate([getattr(t, name) for t in tables], axis=0)
+            for name in cls._columns
+        }
+        blocks = [t.vertices for t in tables if len(t) > 0]
+        if len(blocks) == 0 or any(block is None for block in blocks):
+            vertices = None
+        else:
+            m = max(block.shape[1] for block in blocks)
+            vertices = np.concatenate(
+                [
+                    np.pad(block, ((0, 0), (0, m - block.shape[1]), (0, 0)), constant_values=np.nan)
+                    for block in blocks
+                ],
+                axis=0,
+            )
+        t = next((t for t in tables if len(t) > 0), tables[0])
+        return cls(
+            vertices=vertices,
+            incident_wave_vector=t.incident_wave_vector,
+            wavelength=t.wavelength,
+            incident_polarization_vector=t.incident_polarization_vector,
+            rotation_axis=t.rotation_axis,
+            phases=t.phases,
+            **columns,
+        )
+
+    def __len__(self):
+        return self.time.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self._row(int(index))
+        columns = {name: getattr(self, name)[index] for name in self._columns}
+        return ScatteringTable(
+            vertices=None if self.vertices is None else self.vertices[index],
+            incident_wave_vector=self.incident_wave_vector,
+            wavelength=self.wavelength,
+            incident_polarization_vector=self.incident_polarization_vector,
+            rotation_axis=self.rotation_axis,
+            phases=self.phases,
+            **columns,
+        )
+
+    def _row(self, i):
+        """Lazy :class:`xrd_simulator.scattering_unit.ScatteringUnit` view of row i, the hull is built on demand."""
+        if i < 0:
+            i += len(self)
+        if self.vertices is None:
+            vertices = None
+        else:
+            vertices = self.vertices[i]
+            vertices = vertices[~np.isnan(vertices[:, 0])]
+        return ScatteringUnit(
+            None,
+            self.scattered_wave_vector[i],
+            self.incident_wave_vector,
+            self.wavelength,
+            self.incident_polarization_vector,
+            self.rotation_axis,
+            self.time[i],
+            self.phases[self.phase_indx[i]],
+            self.hkl_indx[i],
+            self.element_index[i],
+            zd=self.zd[i],
+            yd=self.yd[i],
+            vertices=vertices,
+            volume=self.volume[i],
+        )
+
+    def sort(self, by="time"):
+        """Return a copy of the table with rows sorted by the column ``by``.
+        """
+        return self[np.argsort(getattr(self, by), kind="stable")]
+
+    @property
+    def hkl(self):
+        """hkl (:obj:`numpy array`): Miller indices [h,k,l] of all rows ``shape=(n,3)``."""
+        hkl = np.zeros((len(self), 3))
+        for i, phase in enumerate(self.phases):
+            mask = self.phase_indx == i
+            hkl[mask] = phase.miller_indices[self.hkl_indx[mask]]
+        return hkl
+
+    @property
+    def centroid(self):
+        """centroid (:obj:`numpy array`): centroids of the scattering regions ``shape=(n,3)``."""
+        return np.nanmean(self.vertices, axis=1)
+
+    @property
+    def lorentz_factor(self):
+        """Compute the Lorentz intensity factors of all rows, ``np.inf`` where the factor is singular ``shape=(n,)``."""
+        k = self.incident_wave_vector
+        kp = self.scattered_wave_vector
+        kp_dot_k = kp.dot(k)
+        theta = np.arccos(kp_dot_k / (np.linalg.norm(k) ** 2)) / 2.0
+        korthogonal = kp - np.outer(kp_dot_k / (np.linalg.norm(k) ** 2), k)
+        eta = np.arccos(
+            korthogonal.dot(self.rotation_axis) / np.linalg.norm(korthogonal, axis=1)
+        )
+        tol = 0.5
+        singular = (
+            (np.abs(np.degrees(eta)) < tol)
+            | (np.abs(np.degrees(eta)) > 180 - tol)
+            | (np.degrees(theta) < tol)
+        )
+        lorentz_factor = np.full((len(self),), np.inf)
+        lorentz_factor[~singular] = 1.0 / (
+            np.sin(2 * theta[~singular]) * np.abs(np.sin(eta[~singular]))
+        )
+        return lorentz_factor
+
+    @property
+    def polarization_factor(self):
+        """Compute the Polarization intensity factors of all rows ``shape=(n,)``."""
+        khatp = self.scattered_wave_vector / np.linalg.norm(
+            self.scattered_wave_vector, axis=1
+        ).reshape(-1, 1)
+        return 1 - khatp.dot(self.incident_polarization_vector) ** 2
+
+    @property
+    def structure_factor(self):
+        """Squared norm of the unit cell structure factors of all rows ``shape=(n,)``.
+
+        Raises a ValueError if a phase of the table has no structure factors.
+        """
+        structure_factor = np.zeros((len(self),))
+        for i, phase in enumerate(self.phases):
+            mask = self.phase_indx == i
+            if not np.any(mask):
+                continue
+            if phase.structure_factors is None:
+                raise ValueError(
+                    "Structure factors have not been set, .cif file is required at sample instantiation."
+                )
+            F = phase.structure_factors[self.hkl_indx[mask]]
+            structure_factor[mask] = F[:, 0] ** 2 + F[:, 1] ** 2
+        return structure_factor
+
+
+def _pad_vertices(vertices):
+    """Stack a list of ``shape=(m_i,3)`` vertex arrays into a ``np.nan`` padded ``shape=(n,max(m_i),3)`` array."""
+    if len(vertices) == 0:
+        return np.zeros((0, 0, 3))
+    max_number_of_vertices = max(v.shape[0] for v in vertices)
+    padded = np.full((len(vertices), max_number_of_vertices, 3), np.nan)
+    for i, v in enumerate(vertices):
+        padded[i, : v.shape[0]] = v
+    return padded
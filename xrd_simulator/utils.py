@@ -11,6 +11,8 @@ Functions:
     _cif_open: Open a CIF file using the ReadCif function from the CifFile module.
     _print_progress: Print a progress bar in the executing shell terminal.
     _clip_line_with_convex_polyhedron: Compute lengths of parallel lines clipped by a convex polyhedron.
+    _project_convex_polyhedra: Render the projections of many convex polyhedra onto a pixel grid in parallel.
+    _get_tetrahedron_halfspaces: Compute outward face halfspace equations of tetrahedrons.
     alpha_to_quarternion: Generate a unit quaternion from spherical angle coordinates on the S3 ball.
     lab_strain_to_B_matrix: Convert strain tensors in lab coordinates to lattice matrices (B matrices).
     _get_circumscribed_sphere_centroid: Compute the centroid of a circumscribed sphere for a given set of points.
@@ -33,7 +35,8 @@ from itertools import combinations
 from CifFile import ReadCif
 from scipy.spatial.transform import Rotation
 import numpy as np
-from numba import njit
+import numba
+from numba import njit, prange
 
 
 def _diffractogram(diffraction_pattern, det_centre_z, det_centre_y, binsize=1.0):
@@ -160,6 +163,103 @@ def _clip_line_with_convex_polyhedron(
     return clip_lengths
 
 
+@njit(parallel=True)
+def _project_convex_polyhedra(
+    det_corner_0,
+    zdhat,
+    ydhat,
+    pixel_size_z,
+    pixel_size_y,
+    frame_shape,
+    boxes,
+    ray_directions,
+    plane_normals,
+    plane_offsets,
+    number_of_planes,
+    weights,
+):
+    """Render the parametric projections of many convex polyhedra onto a detector pixel grid in parallel.
+
+    Each polyhedron is clipped by the rays traced from the detector pixels (within the polyhedron bounding box)
+    along the polyhedron ray direction, as in :func:`_clip_line_with_convex_polyhedron`. The clip lengths are
+    weighted and accumulated into per-thread frame buffers that are summed at the end.
+
+    Args:
+        det_corner_0, zdhat, ydhat (:obj:`numpy array`): Detector origin and basis vectors ``shape=(3,)``.
+        pixel_size_z, pixel_size_y (:obj:`float`): Pixel side lengths.
+        frame_shape (:obj:`tuple` of :obj:`int`): Number of pixels along zdhat and ydhat.
+        boxes (:obj:`numpy array`): Pixel index bounding boxes, row i gives the frame subgrid
+            ``[boxes[i,0]:boxes[i,1], boxes[i,2]:boxes[i,3]]`` of polyhedron i, ``shape=(n,4)``
+        ray_directions (:obj:`numpy array`): Normalised ray directions of the polyhedra, ``shape=(n,3)``
+        plane_normals (:obj:`numpy array`): Outwards face normals padded to a common number of faces ``shape=(n,m,3)``
+        plane_offsets (:obj:`numpy array`): Face plane offsets such that interior points x satisfy
+            ``plane_normals[i,j].dot(x) + plane_offsets[i,j] < 0``, ``shape=(n,m)``
+        number_of_planes (:obj:`numpy array`): Number of faces (non padded planes) per polyhedron ``shape=(n,)``
+        weights (:obj:`numpy array`): Intensity weights of the clip lengths ``shape=(n,)``
+
+    Returns:
+        (:obj:`tuple`) the rendered frame ``shape=frame_shape`` and the summed clip lengths of each polyhedron
+        ``shape=(n,)``.
+
+    """
+    number_of_polyhedra = boxes.shape[0]
+    number_of_chunks = min(numba.get_num_threads(), max(number_of_polyhedra, 1))
+    frame_buffers = np.zeros((number_of_chunks, frame_shape[0], frame_shape[1]))
+    clip_length_sums = np.zeros((number_of_polyhedra,))
+    chunk_size = (number_of_polyhedra + number_of_chunks - 1) // number_of_chunks
+    for c in prange(number_of_chunks):
+        for i in range(c * chunk_size, min((c + 1) * chunk_size, number_of_polyhedra)):
+            d = ray_directions[i]
+            for row in range(boxes[i, 0], boxes[i, 1]):
+                for col in range(boxes[i, 2], boxes[i, 3]):
+                    x = det_corner_0[0] + row * pixel_size_z * zdhat[0] + col * pixel_size_y * ydhat[0]
+                    y = det_corner_0[1] + row * pixel_size_z * zdhat[1] + col * pixel_size_y * ydhat[1]
+                    z = det_corner_0[2] + row * pixel_size_z * zdhat[2] + col * pixel_size_y * ydhat[2]
+                    t_e, t_l = -np.inf, np.inf
+                    for j in range(number_of_planes[i]):
+                        n = plane_normals[i, j]
+                        t_2 = n[0] * d[0] + n[1] * d[1] + n[2] * d[2]
+                        if t_2 == 0:
+                            continue
+                        t_1 = -plane_offsets[i, j] - (n[0] * x + n[1] * y + n[2] * z)
+                        t_i = t_1 / t_2
+                        if t_2 < 0 and t_i > t_e:
+                            t_e = t_i
+                        elif t_2 > 0 and t_i < t_l:
+                            t_l = t_i
+                    if t_l > t_e:
+                        clip_length_sums[i] += t_l - t_e
+                        frame_buffers[c, row, col] += weights[i] * (t_l - t_e)
+    frame = np.zeros((frame_shape[0], frame_shape[1]))
+    for c in range(number_of_chunks):
+        frame += frame_buffers[c]
+    return frame, clip_length_sums
+
+
+def _get_tetrahedron_halfspaces(tetrahedra):
+    """Compute the outwards face halfspace equations of tetrahedrons.
+
+    Args:
+        tetrahedra (:obj:`numpy array`): Tetrahedron vertices ``shape=(n,4,3)``.
+
+    Returns:
+        (:obj:`tuple`) normalised outwards face normals ``shape=(n,4,3)`` and offsets ``shape=(n,4)``, face j is
+        opposite to vertex j and interior points x satisfy ``normals[i,j].dot(x) + offsets[i,j] < 0``.
+
+    """
+    normals = np.zeros((tetrahedra.shape[0], 4, 3))
+    offsets = np.zeros((tetrahedra.shape[0], 4))
+    for j in range(4):
+        a, b, c = (tetrahedra[:, k, :] for k in range(4) if k != j)
+        normal = np.cross(b - a, c - a)
+        normal /= np.linalg.norm(normal, axis=1)[:, np.newaxis]
+        inwards = np.sum(normal * (tetrahedra[:, j, :] - a), axis=1) > 0
+        normal[inwards] *= -1
+        normals[:, j, :] = normal
+        offsets[:, j] = -np.sum(normal * a, axis=1)
+    return normals, offsets
+
+
 def alpha_to_quarternion(alpha_1, alpha_2, alpha_3):
     """Generate a unit quarternion by providing spherical angle coordinates on the S3 ball.
 